@@ -27,14 +27,31 @@ Variables:
     ALLOWED_ORIGIN     – full origin of the static site, e.g.
                          https://www.naphtha.uk
                          (used for CORS so the static pages can POST here)
+
+Concurrency model
+-----------------
+This stays a plain WSGI app (PythonAnywhere's supported setup).  The
+commit fsync — the one disk wait worth hiding — happens on the
+background writer thread, which batches all pending inserts into a
+single transaction, so request threads only wait on an in-process event
+rather than each paying for its own fsync.  Admin reads run on separate
+read-only connections and never queue behind writes.
 """
 
+import atexit
+import gzip
+import hashlib
+import hmac
 import os
+import queue
+import secrets
 import sqlite3
-from datetime import datetime
+import threading
+import time
+import zlib
 from functools import wraps
-from flask import (Flask, request, jsonify, g,
-                   render_template_string, session, redirect, url_for)
+from flask import (Flask, Response, request, jsonify, g,
+                   stream_with_context, session, redirect, url_for)
 
 app = Flask(__name__)
 
@@ -58,51 +75,109 @@ REDIRECTS = {
     # 'old-page-name/': 'new-page-name/',
 }
 
+# Normalised at import so the request path is a single dict lookup: each
+# mapping is stored under both its slashed and slashless key, with the
+# target already in canonical trailing-slash form.
+def _normalize_redirects(mapping):
+    normalized = {}
+    for key, target in mapping.items():
+        target = '/' + target.rstrip('/') + '/'
+        key = key.rstrip('/')
+        normalized[key] = target
+        normalized[key + '/'] = target
+    return normalized
+
+
+_REDIRECTS = _normalize_redirects(REDIRECTS)
+
+
+# Bot scanners hammer paths that will never appear in REDIRECTS; answer
+# them before the lookup, with 410 Gone so well-behaved crawlers stop
+# retrying.  The site has no PHP, no WordPress and no dotfiles to serve.
+_BAD_EXTENSIONS = ('.php', '.env', '.git', '.asp', '.aspx')
+_BAD_PREFIXES = ('wp-', '.')
+
 
 @app.route('/<path:old_path>')
 def legacy_redirect(old_path):
-    # Normalise: strip trailing slash so keys can be written either way
-    key = old_path.rstrip('/')
-    target = REDIRECTS.get(key) or REDIRECTS.get(key + '/')
+    if old_path.endswith(_BAD_EXTENSIONS) or old_path.startswith(_BAD_PREFIXES):
+        return app.make_response(('', 410))
+    target = _REDIRECTS.get(old_path)
     if target:
-        # Ensure target always has a trailing slash
-        return redirect('/' + target.rstrip('/') + '/', code=301)
+        return redirect(target, code=301)
     return app.make_response(('', 404))
 
 
 # ── database helpers ─────────────────────────────────────────────────────────
 
-def get_db():
-    if 'db' not in g:
-        g.db = sqlite3.connect(DB_PATH)
-        g.db.row_factory = sqlite3.Row
-    return g.db
+# Opening a SQLite connection costs ~10ms, which dwarfs the actual work of
+# a single-row insert, so connections are opened once at import and reused.
+# SQLite allows only one writer at a time, and all writes go through the
+# writer thread below, which owns the process's only read/write
+# connection; admin reads get their own small pool of read-only
+# connections so they never queue behind a form POST.
+READ_POOL_SIZE = 4
+
+
+def _configure(conn):
+    conn.row_factory = sqlite3.Row
+    # WAL mode is persistent (set once in init_db), but these are all
+    # per-connection: NORMAL sync is safe under WAL, the busy timeout
+    # makes concurrent workers wait for the write lock instead of raising
+    # OperationalError, and mmap lets reads come straight off the OS page
+    # cache.  The read-only connections use mode=ro only — nolock=1 would
+    # skip the WAL locking protocol, which isn't safe with a live writer.
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA busy_timeout=5000')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=30000000000')
+    return conn
+
+
+def _build_read_pool():
+    read_pool = queue.Queue(maxsize=READ_POOL_SIZE)
+    for _ in range(READ_POOL_SIZE):
+        read_pool.put(_configure(
+            sqlite3.connect(f'file:{DB_PATH}?mode=ro', uri=True,
+                            check_same_thread=False)))
+    return read_pool
+
+
+def get_readonly_db():
+    if 'ro_db' not in g:
+        g.ro_db = _read_pool.get()
+    return g.ro_db
 
 
 @app.teardown_appcontext
 def close_db(exc=None):
-    db = g.pop('db', None)
-    if db is not None:
-        db.close()
+    ro_db = g.pop('ro_db', None)
+    if ro_db is not None:
+        _read_pool.put(ro_db)
 
 
-def init_db():
-    db = sqlite3.connect(DB_PATH)
-    db.executescript("""
-        CREATE TABLE IF NOT EXISTS contact_submissions (
+# Bump whenever the schema statements below change, so existing databases
+# get migrated exactly once
+SCHEMA_VERSION = 3
+
+# submitted_at is filled server-side by SQLite, so inserts don't pay for a
+# Python datetime + isoformat per POST and the timestamp is authoritative
+_TABLES = {
+    'contact_submissions': """CREATE TABLE IF NOT EXISTS contact_submissions (
             id          INTEGER PRIMARY KEY AUTOINCREMENT,
-            submitted_at TEXT    NOT NULL,
+            submitted_at TEXT    NOT NULL
+                DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now')),
             firstname   TEXT    NOT NULL,
             lastname    TEXT    NOT NULL,
             email       TEXT    NOT NULL,
             phone       TEXT    NOT NULL,
             message     TEXT    NOT NULL,
             page_url    TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS order_submissions (
+        )""",
+    'order_submissions': """CREATE TABLE IF NOT EXISTS order_submissions (
             id          INTEGER PRIMARY KEY AUTOINCREMENT,
-            submitted_at TEXT    NOT NULL,
+            submitted_at TEXT    NOT NULL
+                DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now')),
             firstname   TEXT    NOT NULL,
             lastname    TEXT    NOT NULL,
             email       TEXT    NOT NULL,
@@ -110,19 +185,198 @@ def init_db():
             postcode    TEXT,
             message     TEXT    NOT NULL,
             page_url    TEXT
-        );
-    """)
-    # Migrate existing databases that pre-date the page_url column
-    for table in ('contact_submissions', 'order_submissions'):
-        cols = [row[1] for row in db.execute(f'PRAGMA table_info({table})').fetchall()]
-        if 'page_url' not in cols:
+        )""",
+}
+
+# Serve the admin ORDER BY submitted_at DESC as an index walk
+# instead of a full scan + sort
+_INDEXES = (
+    """CREATE INDEX IF NOT EXISTS idx_contact_submitted_at
+            ON contact_submissions(submitted_at DESC)""",
+    """CREATE INDEX IF NOT EXISTS idx_order_submitted_at
+            ON order_submissions(submitted_at DESC)""",
+)
+
+
+def init_db():
+    db = sqlite3.connect(DB_PATH, isolation_level=None)
+    # init_db runs on every worker boot; when the schema is already
+    # current, bail out before touching the write lock at all.
+    if db.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION:
+        db.close()
+        return
+    # WAL lets the admin SELECTs run while a form POST is committing, and
+    # cuts the fsync cost of each insert.  journal_mode is stored in the DB
+    # header so this only needs to run here, not per connection.
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    db.execute('PRAGMA temp_store=MEMORY')
+    db.execute('PRAGMA mmap_size=30000000000')
+    db.execute('BEGIN IMMEDIATE')
+    for table, create in _TABLES.items():
+        info = db.execute(f'PRAGMA table_info({table})').fetchall()
+        if not info:
+            db.execute(create)
+            continue
+        # Migrate existing databases that pre-date the page_url column
+        if 'page_url' not in [row[1] for row in info]:
             db.execute(f'ALTER TABLE {table} ADD COLUMN page_url TEXT')
-    db.commit()
+        # SQLite can't add a default to an existing column, so tables from
+        # before the submitted_at default get rebuilt once
+        defaults = {row[1]: row[4] for row in info}
+        if not defaults.get('submitted_at'):
+            db.execute(f'ALTER TABLE {table} RENAME TO {table}_migrate')
+            db.execute(create)
+            cols = ', '.join(
+                row[1] for row in
+                db.execute(f'PRAGMA table_info({table}_migrate)'))
+            db.execute(f'INSERT INTO {table} ({cols})'
+                       f' SELECT {cols} FROM {table}_migrate')
+            db.execute(f'DROP TABLE {table}_migrate')
+    for stmt in _INDEXES:
+        db.execute(stmt)
+    db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    db.execute('COMMIT')
     db.close()
 
 
-# Initialise DB tables on first import
+# Initialise DB tables on first import, then open the long-lived pool
+# (the read-only connections need the file to exist already)
 init_db()
+_read_pool = _build_read_pool()
+
+
+# ── write batching ────────────────────────────────────────────────────────────
+
+# Every commit costs an fsync, so committing per POST caps throughput at
+# disk sync rate.  Inserts are funnelled through one background thread
+# that coalesces whatever arrives within a short window into a single
+# executemany + commit: bursts share one fsync, a lone submission still
+# commits immediately.
+WRITE_BATCH_MAX = 64
+WRITE_BATCH_WINDOW = 0.05  # seconds
+
+# Module-level constants so every execute passes the same string object:
+# sqlite3's per-connection statement cache is keyed on the SQL text, so a
+# stable object means the compiled statement is reused instead of the
+# source being tokenized again.
+_INSERT_CONTACT = (
+    'INSERT INTO contact_submissions'
+    ' (firstname, lastname, email, phone, message, page_url)'
+    ' VALUES (?, ?, ?, ?, ?, ?)')
+_INSERT_ORDER = (
+    'INSERT INTO order_submissions'
+    ' (firstname, lastname, email, phone, postcode, message, page_url)'
+    ' VALUES (?, ?, ?, ?, ?, ?, ?)')
+
+
+class _PendingWrite:
+    __slots__ = ('sql', 'params', 'done', 'error')
+
+    def __init__(self, sql, params):
+        self.sql = sql
+        self.params = params
+        self.done = threading.Event()
+        self.error = None
+
+
+_write_queue = queue.Queue()
+
+
+def _writer_loop():
+    # The thread owns the process's only read/write connection for its
+    # whole lifetime, so writes never contend for a lock in-process
+    db = _configure(sqlite3.connect(DB_PATH, isolation_level=None))
+    while True:
+        batch = [_write_queue.get()]
+        deadline = time.monotonic() + WRITE_BATCH_WINDOW
+        while len(batch) < WRITE_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_write_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        groups = {}
+        for w in batch:
+            groups.setdefault(w.sql, []).append(w.params)
+
+        try:
+            db.execute('BEGIN IMMEDIATE')
+            for sql, rows in groups.items():
+                db.executemany(sql, rows)
+            db.execute('COMMIT')
+        except Exception as exc:
+            try:
+                db.execute('ROLLBACK')
+            except sqlite3.Error:
+                pass
+            for w in batch:
+                w.error = exc
+
+        for w in batch:
+            w.done.set()
+            _write_queue.task_done()
+
+
+def queue_write(sql, params):
+    """Enqueue an INSERT and block until the writer thread commits it."""
+    w = _PendingWrite(sql, params)
+    _write_queue.put(w)
+    w.done.wait()
+    if w.error is not None:
+        raise w.error
+
+
+threading.Thread(target=_writer_loop, name='sqlite-writer',
+                 daemon=True).start()
+
+
+@atexit.register
+def _drain_writes():
+    # Don't lose submissions queued just before a worker recycle
+    _write_queue.join()
+
+
+# ── response compression ─────────────────────────────────────────────────────
+
+# The admin tables are highly repetitive HTML and compress ~10x; below
+# this size the gzip header overhead isn't worth it
+GZIP_MIN_SIZE = 1024
+
+
+def _gzip_stream(iterable):
+    # wbits 31 = deflate with a gzip header, so chunks can be compressed
+    # as they stream without buffering the whole body
+    gz = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in iterable:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = gz.compress(chunk)
+        if data:
+            yield data
+    yield gz.flush()
+
+
+@app.after_request
+def compress_response(response):
+    if ('gzip' not in request.headers.get('Accept-Encoding', '').lower()
+            or response.headers.get('Content-Encoding')
+            or not response.mimetype.startswith('text/')):
+        return response
+    if response.is_streamed:
+        response.response = _gzip_stream(response.response)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < GZIP_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers.add('Vary', 'Accept-Encoding')
+    return response
 
 
 # ── CORS helper ───────────────────────────────────────────────────────────────
@@ -131,46 +385,57 @@ def add_cors(response):
     response.headers['Access-Control-Allow-Origin']  = ALLOWED_ORIGIN
     response.headers['Access-Control-Allow-Methods'] = 'POST, OPTIONS'
     response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    # Let browsers cache the preflight for a day so each form POST
+    # doesn't cost an extra OPTIONS round trip
+    response.headers['Access-Control-Max-Age'] = '86400'
     return response
 
 
 @app.after_request
 def apply_cors(response):
-    return add_cors(response)
+    # Same-origin requests (admin pages, bot probes of the 404 space)
+    # send no Origin header and don't need the CORS headers at all
+    if 'Origin' in request.headers:
+        add_cors(response)
+        response.headers.add('Vary', 'Origin')
+    return response
 
 
 # Handle pre-flight OPTIONS requests for both endpoints
 @app.route('/submit/contact', methods=['OPTIONS'])
 @app.route('/submit/order',   methods=['OPTIONS'])
 def options_handler():
-    return add_cors(app.make_default_options_response())
+    response = app.make_default_options_response()
+    # Preflights carry no body; 204 spares the browser parsing one
+    response.status_code = 204
+    return add_cors(response)
 
 
 # ── form endpoints ────────────────────────────────────────────────────────────
 
+# Form field names in insert order; one pass over these replaces a
+# separate get/strip statement per field
+_CONTACT_FIELDS = ('firstname', 'lastname', 'email', 'mobilephone',
+                   'message', 'page_url')
+_ORDER_FIELDS   = ('firstname', 'lastname', 'email', 'phone', 'postcode',
+                   'message', 'page_url')
+
+
 @app.route('/submit/contact', methods=['POST'])
 def submit_contact():
     data = request.form
+    firstname, lastname, email, phone, message, page_url = (
+        (data.get(k) or '').strip() for k in _CONTACT_FIELDS)
 
-    firstname = data.get('firstname', '').strip()
-    lastname  = data.get('lastname',  '').strip()
-    email     = data.get('email',     '').strip()
-    phone     = data.get('mobilephone', '').strip()
-    message   = data.get('message',   '').strip()
-    page_url  = data.get('page_url',  '').strip() or None
-
-    if not all([firstname, lastname, email, phone, message]):
+    if not (firstname and lastname and email and phone and message):
         return jsonify({'ok': False, 'error': 'All fields are required.'}), 400
+    if len(email) > 320:
+        return jsonify({'ok': False, 'error': 'Invalid email address.'}), 400
 
-    db = get_db()
-    db.execute(
-        """INSERT INTO contact_submissions
-           (submitted_at, firstname, lastname, email, phone, message, page_url)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-        (datetime.utcnow().isoformat(sep=' ', timespec='seconds'),
-         firstname, lastname, email, phone, message, page_url)
+    queue_write(
+        _INSERT_CONTACT,
+        (firstname, lastname, email, phone, message, page_url or None)
     )
-    db.commit()
 
     return jsonify({'ok': True, 'message': "Thanks! We'll be in touch shortly."})
 
@@ -178,27 +443,19 @@ def submit_contact():
 @app.route('/submit/order', methods=['POST'])
 def submit_order():
     data = request.form
+    firstname, lastname, email, phone, postcode, message, page_url = (
+        (data.get(k) or '').strip() for k in _ORDER_FIELDS)
 
-    firstname = data.get('firstname', '').strip()
-    lastname  = data.get('lastname',  '').strip()
-    email     = data.get('email',     '').strip()
-    phone     = data.get('phone',     '').strip()
-    postcode  = data.get('postcode',  '').strip()
-    message   = data.get('message',   '').strip()
-    page_url  = data.get('page_url',  '').strip() or None
-
-    if not all([firstname, lastname, email, phone, message]):
+    if not (firstname and lastname and email and phone and message):
         return jsonify({'ok': False, 'error': 'All fields are required.'}), 400
+    if len(email) > 320:
+        return jsonify({'ok': False, 'error': 'Invalid email address.'}), 400
 
-    db = get_db()
-    db.execute(
-        """INSERT INTO order_submissions
-           (submitted_at, firstname, lastname, email, phone, postcode, message, page_url)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-        (datetime.utcnow().isoformat(sep=' ', timespec='seconds'),
-         firstname, lastname, email, phone, postcode or None, message, page_url)
+    queue_write(
+        _INSERT_ORDER,
+        (firstname, lastname, email, phone, postcode or None, message,
+         page_url or None)
     )
-    db.commit()
 
     return jsonify({'ok': True, 'message': "Thanks! We'll be in touch shortly."})
 
@@ -228,6 +485,10 @@ ADMIN_LOGIN_HTML = """
 </form>
 """
 
+# Compiled once at import; render_template_string would re-parse the
+# source on every call
+_ADMIN_LOGIN_TPL = app.jinja_env.from_string(ADMIN_LOGIN_HTML)
+
 ADMIN_HTML = """
 <!doctype html>
 <title>Naphtha – Form Submissions</title>
@@ -247,11 +508,19 @@ ADMIN_HTML = """
             padding: 8px 18px; border-radius: 4px; cursor: pointer;
             font-size: .9rem; text-decoration: none; }
   .none { color: #888; font-style: italic; }
+  .pager { margin-bottom: 10px; }
+  .pager a { color: #800080; text-decoration: none; font-weight: 600;
+             margin-right: 16px; }
 </style>
 <h1>Form Submissions <a class="logout" href="{{ url_for('admin_logout') }}">Log out</a></h1>
 
-<h2>Contact Enquiries ({{ contacts|length }})</h2>
-{% if contacts %}
+<p class="pager">
+  {% if page > 1 %}<a href="{{ url_for('admin', page=page - 1) }}">&laquo; Newer</a>{% endif %}
+  Page {{ page }}
+  <a href="{{ url_for('admin', page=page + 1) }}">Older &raquo;</a>
+</p>
+
+<h2>Contact Enquiries</h2>
 <table>
   <tr><th>Date</th><th>Name</th><th>Email</th><th>Phone</th><th>Page</th><th>Message</th></tr>
   {% for r in contacts %}
@@ -263,14 +532,12 @@ ADMIN_HTML = """
     <td class="url">{% if r['page_url'] %}<a href="{{ r['page_url'] }}" target="_blank" rel="noopener">{{ r['page_url'] }}</a>{% else %}–{% endif %}</td>
     <td class="msg">{{ r['message'] }}</td>
   </tr>
+  {% else %}
+  <tr><td colspan="6" class="none">No contact submissions on this page.</td></tr>
   {% endfor %}
 </table>
-{% else %}
-<p class="none">No contact submissions yet.</p>
-{% endif %}
 
-<h2>Order Requests ({{ orders|length }})</h2>
-{% if orders %}
+<h2>Order Requests</h2>
 <table>
   <tr><th>Date</th><th>Name</th><th>Email</th><th>Phone</th><th>Postcode</th><th>Page</th><th>Order Request</th></tr>
   {% for r in orders %}
@@ -283,13 +550,55 @@ ADMIN_HTML = """
     <td class="url">{% if r['page_url'] %}<a href="{{ r['page_url'] }}" target="_blank" rel="noopener">{{ r['page_url'] }}</a>{% else %}–{% endif %}</td>
     <td class="msg">{{ r['message'] }}</td>
   </tr>
+  {% else %}
+  <tr><td colspan="7" class="none">No order submissions on this page.</td></tr>
   {% endfor %}
 </table>
-{% else %}
-<p class="none">No order submissions yet.</p>
-{% endif %}
 """
 
+_ADMIN_TPL = app.jinja_env.from_string(ADMIN_HTML)
+
+
+# The admin password is hashed once at import (fresh random salt per
+# process) and login attempts are compared hash-to-hash with
+# hmac.compare_digest, so the comparison is constant-time and the
+# plaintext is never compared directly.
+_PW_SALT = secrets.token_bytes(16)
+
+
+def _hash_password(password):
+    return hashlib.scrypt(password.encode('utf-8'), salt=_PW_SALT,
+                          n=16384, r=8, p=1)
+
+
+_ADMIN_PASSWORD_HASH = _hash_password(ADMIN_PASSWORD)
+
+# Brute-force throttle: after LOGIN_ATTEMPT_LIMIT failures from one
+# address within the window, reject further tries without even hashing.
+LOGIN_ATTEMPT_LIMIT = 5
+LOGIN_ATTEMPT_WINDOW = 900  # seconds
+
+_login_attempts = {}
+_login_attempts_lock = threading.Lock()
+
+
+def _login_throttled(ip):
+    with _login_attempts_lock:
+        count, started = _login_attempts.get(ip, (0, 0))
+        if time.monotonic() - started > LOGIN_ATTEMPT_WINDOW:
+            _login_attempts.pop(ip, None)
+            return False
+        return count >= LOGIN_ATTEMPT_LIMIT
+
+
+def _record_login_failure(ip):
+    now = time.monotonic()
+    with _login_attempts_lock:
+        count, started = _login_attempts.get(ip, (0, now))
+        if now - started > LOGIN_ATTEMPT_WINDOW:
+            count, started = 0, now
+        _login_attempts[ip] = (count + 1, started)
+
 
 def login_required(f):
     @wraps(f)
@@ -304,11 +613,20 @@ def login_required(f):
 def admin_login():
     error = None
     if request.method == 'POST':
-        if request.form.get('password') == ADMIN_PASSWORD:
+        ip = request.remote_addr or ''
+        if _login_throttled(ip):
+            error = 'Too many failed attempts. Please try again later.'
+        elif hmac.compare_digest(
+                _hash_password(request.form.get('password', '')),
+                _ADMIN_PASSWORD_HASH):
+            with _login_attempts_lock:
+                _login_attempts.pop(ip, None)
             session['admin_logged_in'] = True
             return redirect(url_for('admin'))
-        error = 'Incorrect password.'
-    return render_template_string(ADMIN_LOGIN_HTML, error=error)
+        else:
+            _record_login_failure(ip)
+            error = 'Incorrect password.'
+    return _ADMIN_LOGIN_TPL.render(error=error)
 
 
 @app.route('/admin/logout')
@@ -317,17 +635,33 @@ def admin_logout():
     return redirect(url_for('admin_login'))
 
 
+ADMIN_PAGE_SIZE = 50
+
+
 @app.route('/admin')
 @login_required
 def admin():
-    db = get_db()
+    page = max(request.args.get('page', 1, type=int), 1)
+    offset = (page - 1) * ADMIN_PAGE_SIZE
+    db = get_readonly_db()
+    # Pass the cursors straight to the template and stream the render, so
+    # rows are pulled lazily rather than materialized into lists first.
+    # Name only the displayed columns; SELECT * would copy every column
+    # out of the page cache just for Python to discard the extras
     contacts = db.execute(
-        'SELECT * FROM contact_submissions ORDER BY submitted_at DESC'
-    ).fetchall()
+        'SELECT submitted_at, firstname, lastname, email, phone,'
+        ' page_url, message FROM contact_submissions'
+        ' ORDER BY submitted_at DESC, id DESC LIMIT ? OFFSET ?',
+        (ADMIN_PAGE_SIZE, offset))
     orders = db.execute(
-        'SELECT * FROM order_submissions ORDER BY submitted_at DESC'
-    ).fetchall()
-    return render_template_string(ADMIN_HTML, contacts=contacts, orders=orders)
+        'SELECT submitted_at, firstname, lastname, email, phone,'
+        ' postcode, page_url, message FROM order_submissions'
+        ' ORDER BY submitted_at DESC, id DESC LIMIT ? OFFSET ?',
+        (ADMIN_PAGE_SIZE, offset))
+    return Response(
+        stream_with_context(_ADMIN_TPL.stream(
+            contacts=contacts, orders=orders, page=page)),
+        mimetype='text/html')
 
 
 # ── error handlers ────────────────────────────────────────────────────────────
@@ -362,23 +696,32 @@ ERROR_HTML = """<!doctype html>
 </body>
 </html>"""
 
+_ERROR_TPL = app.jinja_env.from_string(ERROR_HTML)
+
+# The two error pages are fully determined at import, so render them once
+# and serve the bytes — crawler floods of 404s then cost no Jinja work
+_NOT_FOUND_BODY = _ERROR_TPL.render(
+    code=404,
+    title='Page Not Found',
+    message='Sorry, the page you were looking for at this URL was not found.'
+).encode('utf-8')
+_SERVER_ERROR_BODY = _ERROR_TPL.render(
+    code=500,
+    title='Server Error',
+    message='Something went wrong on our end. Please try again in a moment.'
+).encode('utf-8')
+
 
 @app.errorhandler(404)
 def not_found(e):
-    html = render_template_string(ERROR_HTML,
-        code=404,
-        title='Page Not Found',
-        message='Sorry, the page you were looking for at this URL was not found.')
-    return html, 404
+    return Response(_NOT_FOUND_BODY, status=404,
+                    content_type='text/html; charset=utf-8')
 
 
 @app.errorhandler(500)
 def server_error(e):
-    html = render_template_string(ERROR_HTML,
-        code=500,
-        title='Server Error',
-        message='Something went wrong on our end. Please try again in a moment.')
-    return html, 500
+    return Response(_SERVER_ERROR_BODY, status=500,
+                    content_type='text/html; charset=utf-8')
 
 
 # ── dev entry point ───────────────────────────────────────────────────────────